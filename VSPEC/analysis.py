@@ -5,7 +5,7 @@ This module is designed to allow a user to easily handle
 """
 
 from typing import Dict, Union, Tuple
-from copy import deepcopy
+from functools import lru_cache
 from pathlib import Path
 import warnings
 import numpy as np
@@ -17,9 +17,19 @@ from astropy.table import QTable
 from libpypsg import PyLyr
 
 from VSPEC.config import N_ZFILL, MOLEC_DATA_PATH
+from VSPEC.helpers import get_filename
 from VSPEC import ObservationModel
 
 
+@lru_cache(maxsize=1)
+def _load_molec_data() -> dict:
+    """
+    Read the molecular data file. It never changes, so it is only parsed once.
+    """
+    with open(MOLEC_DATA_PATH, 'rt',encoding='UTF-8') as file:
+        return json.loads(file.read())
+
+
 class PhaseAnalyzer:
     """Class to store and analyze `VSPEC` phase curves
 
@@ -56,62 +66,66 @@ class PhaseAnalyzer:
         """
         self.time = self._observation_data['time']
         self.phase = self._observation_data['phase']
-        self.unique_phase = deepcopy(self.phase)
-        for i in range(len(self.unique_phase) - 1):
-            while self.unique_phase[i] > self.unique_phase[i+1]:
-                self.unique_phase[i+1] += 360*u.deg
-        star = []
-        # star_facing_planet = pd.DataFrame() # not super interesting
-        reflected = []
-        thermal = []
-        total = []
-        noise = []
-        for i in range(self.n_images):
-            filename = path / f'phase{str(i).zfill(N_ZFILL)}.fits'
-            spectra: QTable = QTable.read(filename)
-            if i == 0:  # only do once
-                # wavelength
-                col = 'wavelength'
-                self.wavelength = spectra[col]
-            # star
-            col = 'star'
-            star.append((spectra[col]).to_value(fluxunit))
-            # reflected
-            col = 'reflected'
-            reflected.append((spectra[col]).to_value(fluxunit))
-            # reflected
-            col = 'planet_thermal'
-            thermal.append((spectra[col]).to_value(fluxunit))
-            # total
-            col = 'total'
-            total.append((spectra[col]).to_value(fluxunit))
-            # noise
-            col = 'noise'
-            noise.append((spectra[col]).to_value(fluxunit))
-        self.star = np.asarray(star).T * fluxunit
-        self.reflected = np.asarray(reflected).T * fluxunit
-        self.thermal = np.asarray(thermal).T * fluxunit
-        self.total = np.asarray(total).T * fluxunit
-        self.noise = np.asarray(noise).T * fluxunit
+        # add a full turn each time the phase wraps back around.
+        # `np.unwrap` is not used because it only unwraps jumps larger
+        # than 180 deg, which breaks down for coarse phase sampling.
+        phase = self.phase.to_value(u.deg)
+        n_wraps = np.concatenate([[0], np.cumsum(np.diff(phase) < 0)])
+        self.unique_phase = (phase + 360*n_wraps)*u.deg
+        # the first file sets the wavelength axis and the unit scaling
+        # of each column; every other epoch shares the same layout.
+        first: QTable = QTable.read(path / get_filename(0, N_ZFILL, 'fits'))
+        self.wavelength = first['wavelength']
+        n_wl = len(self.wavelength)
+        columns = {
+            'star': 'star',
+            'reflected': 'reflected',
+            'thermal': 'planet_thermal',
+            'total': 'total',
+            'noise': 'noise'
+        }
+        scales = {col: first[col].unit.to(fluxunit) for col in columns.values()}
+        arrays = {
+            attr: np.empty((n_wl, self.n_images), dtype=np.float64) for attr in columns
+        }
+        for attr, col in columns.items():
+            arrays[attr][:, 0] = first[col].value * scales[col]
+        # The units are already known, so the remaining epochs skip
+        # `QTable.read` and copy the raw columns out of the FITS table.
+        for i in range(1, self.n_images):
+            filename = path / get_filename(i, N_ZFILL, 'fits')
+            with fits.open(filename, memmap=True) as hdul:
+                spectra = hdul[1].data
+                for attr, col in columns.items():
+                    arrays[attr][:, i] = spectra[col] * scales[col]
+        self.star = arrays['star'] * fluxunit
+        self.reflected = arrays['reflected'] * fluxunit
+        self.thermal = arrays['thermal'] * fluxunit
+        self.total = arrays['total'] * fluxunit
+        self.noise = arrays['noise'] * fluxunit
 
         try:
             first_lyr:QTable = PyLyr.from_fits(path / f'layer{str(0).zfill(N_ZFILL)}.fits').prof
             colnames = first_lyr.colnames
-            vartables: Dict[str, QTable] = {}
-            for name in colnames:
-                tab = QTable()
-                vartables[name] = tab
+            # every layer file has the same columns, so take the units once.
+            units = {name: first_lyr[name].unit for name in colnames}
+            # collect the columns first and build each table in one go
+            # rather than paying for `add_column` once per variable per epoch.
+            columns: Dict[str, list] = {name: [] for name in colnames}
             
             for i in range(self.n_images):
-                filename = path / f'layer{str(i).zfill(N_ZFILL)}.fits'
-                dat:QTable = PyLyr.from_fits(filename).prof
+                if i == 0:
+                    dat = first_lyr
+                else:
+                    filename = path / f'layer{str(i).zfill(N_ZFILL)}.fits'
+                    dat:QTable = PyLyr.from_fits(filename).prof
                 for name in colnames:
-                    val = dat[name].value
-                    unit = dat[name].unit
-                    colname=f'col{i}'
-                    vartables[name].add_column(val*unit, name=colname)
+                    columns[name].append(dat[name].value*units[name])
             
-            self.layers: Dict[str, QTable] = vartables
+            names = [f'col{i}' for i in range(self.n_images)]
+            self.layers: Dict[str, QTable] = {
+                name: QTable(cols, names=names, copy=False) for name, cols in columns.items()
+            }
         except FileNotFoundError:
             warnings.warn(
                 'No Layer info, maybe globes or molecular signatures are off', RuntimeWarning)
@@ -137,12 +151,54 @@ class PhaseAnalyzer:
         """
         return cls(model.directories['all_model'], fluxunit)
 
+    @classmethod
+    def from_fits(cls, filename: str) -> 'PhaseAnalyzer':
+        """
+        Initialize a ``PhaseAnalyzer`` instance from a file written by
+        ``PhaseAnalyzer.write_fits``.
+
+        This reads a single file rather than one file per epoch, so it
+        is much faster than reading ``AllModelSpectraValues`` again.
+        Layer data is not saved by ``write_fits``, so ``layers`` is empty.
+
+        Parameters
+        ----------
+        filename : str
+            The `.fits` file to read.
+
+        Examples
+        --------
+        >>> data = PhaseAnalyzer.from_model(model)
+        >>> data.write_fits('phase_curve.fits')
+        ...
+        >>> data = PhaseAnalyzer.from_fits('phase_curve.fits')
+        """
+        data = cls.__new__(cls)
+        with fits.open(filename) as hdul:
+            data._observation_data = QTable.read(hdul['OBS'])
+            data.n_images = int(hdul['PRIMARY'].header['N_images'])
+            phase = hdul['PHASE']
+            data.time = np.array(phase.data['time'], dtype=np.float64) \
+                * u.Unit(phase.header['U_TIME'])
+            data.phase = np.array(phase.data['phase'], dtype=np.float64) \
+                * u.Unit(phase.header['U_PHASE'])
+            data.unique_phase = np.array(phase.data['unique_phase'], dtype=np.float64) \
+                * u.Unit(phase.header['U_UPHASE'])
+            wavelength = hdul['WAVELENGTH']
+            data.wavelength = np.array(wavelength.data['wavelength'], dtype=np.float64) \
+                * u.Unit(wavelength.header['U_WAVE'])
+            for attr in ('total', 'star', 'reflected', 'thermal', 'noise'):
+                hdu = hdul[attr.upper()]
+                flux = np.array(hdu.data, dtype=np.float64) * u.Unit(hdu.header['U_FLUX'])
+                setattr(data, attr, flux)
+        data.layers = fits.HDUList([])
+        return data
+
     def _get_mean_molecular_mass(self):
         """
         Get the mean molecular mass
         """
-        with open(MOLEC_DATA_PATH, 'rt',encoding='UTF-8') as file:
-            molec_data = json.loads(file.read())
+        molec_data = _load_molec_data()
         shape = self.get_layer('Alt').shape
         mean_molec_mass = np.zeros(shape=shape)*u.g/u.mol
         for mol, dat in molec_data.items():
@@ -234,27 +290,30 @@ class PhaseAnalyzer:
         """
         if isinstance(pixel, tuple):
             pixel = slice(*pixel)
-        flux:np.ndarray = getattr(self, source)[pixel, :]
+        # do the math on plain arrays and only attach the unit at the end
+        data: u.Quantity = getattr(self, source)
+        unit = data.unit
+        flux:np.ndarray = data.value[pixel, :]
         if isinstance(noise, bool):
             if noise:
                 flux = flux + \
                     np.random.normal(
-                        scale=self.noise.value[pixel, :])*self.noise.unit
+                        scale=self.noise.to_value(unit)[pixel, :])
         elif isinstance(noise, float) or isinstance(noise, int):
             flux = flux + noise * \
                 np.random.normal(
-                    scale=self.noise.value[pixel, :])*self.noise.unit
+                    scale=self.noise.to_value(unit)[pixel, :])
         else:
             raise ValueError('noise parameter must be bool, float, or int')
         if flux.ndim > 1:
             flux = flux.mean(axis=0)
         if isinstance(normalize, int):
-            flux = (flux/flux[normalize]).to_value(u.dimensionless_unscaled)
+            flux = flux/flux[normalize]
         elif isinstance(normalize, str):
             if normalize == 'max':
-                flux = (flux/flux.max()).to_value(u.dimensionless_unscaled)
+                flux = flux/flux.max()
             elif normalize == 'none':
-                pass
+                flux = flux*unit
             else:
                 raise ValueError(f'Unknown normalization scheme: {normalize}')
         elif isinstance(normalize, bool):
@@ -265,6 +324,7 @@ class PhaseAnalyzer:
                 message = 'Setting `normalize=False` can be dangerous as `True` is an ambigous value. '
                 message += 'Please use `normalize="none"` instead.'
                 warnings.warn(message, RuntimeWarning)
+                flux = flux*unit
         else:
             raise ValueError(f'Unknown normalization parameter: {normalize}')
         return flux
@@ -305,31 +365,33 @@ class PhaseAnalyzer:
         if isinstance(images, tuple):
             images = slice(*images)
         if source == 'noise':
-            flux = self.noise[:, images]**2
-            try:
-                n_images = flux.shape[1]
-                flux = flux.sum(axis=1)/n_images**2
-            except IndexError:
-                pass
-            return np.sqrt(flux)
+            noise = self.noise.value[:, images]
+            if noise.ndim > 1:
+                # sum of squares along the time axis without
+                # materializing the squared array
+                n_images = noise.shape[1]
+                noise = np.sqrt(np.einsum('ij,ij->i', noise, noise))/n_images
+            else:
+                noise = np.abs(noise)
+            return noise*self.noise.unit
         else:
-            flux = getattr(self, source)[:, images]
+            data: u.Quantity = getattr(self, source)
+            unit = data.unit
+            flux: np.ndarray = data.value[:, images]
             if isinstance(noise, bool):
                 if noise:
                     flux = flux + \
                         np.random.normal(
-                            scale=self.noise.value[:, images])*self.noise.unit
+                            scale=self.noise.to_value(unit)[:, images])
             elif isinstance(noise, float) or isinstance(noise, int):
                 flux = flux + noise * \
                     np.random.normal(
-                        scale=self.noise.value[:, images])*self.noise.unit
+                        scale=self.noise.to_value(unit)[:, images])
             else:
                 raise ValueError('noise parameter must be bool, float, or int')
-            try:
+            if flux.ndim > 1:
                 flux = flux.mean(axis=1)
-            except IndexError:  # images is int
-                pass
-            return flux
+            return flux*unit
 
     @property
     def fits(self) -> fits.HDUList:
@@ -348,8 +410,9 @@ class PhaseAnalyzer:
         cols = []
         for col in self._observation_data.colnames:
             array:u.Quantity = self._observation_data[col]
+            unit = None if array.unit is None else str(array.unit)
             cols.append(fits.Column(
-                name=col, array=array.value, format='D'))
+                name=col, array=array.value, format='D', unit=unit))
         obs_tab = fits.BinTableHDU.from_columns(cols)
         obs_tab.name = 'OBS'
 
@@ -23,6 +23,7 @@ def get_planet_indicies(
     ----------
     planet_times : astropy.units.Quantity
         The times (cast to since periastron) at which the planet spectrum was taken.
+        Must be sorted in increasing order.
     tindex : astropy.units.Quantity
         The epoch of the current observation. The goal is to place this between
         two elements of `planet_times`
@@ -38,15 +39,24 @@ def get_planet_indicies(
     ------
     ValueError
         If multiple elements of 'planet_times' are equal to 'tindex'.
+    IndexError
+        If `tindex` is after the last element of `planet_times`.
     """
-    after = planet_times > tindex
-    equal = planet_times == tindex
-    if equal.sum() == 1:
-        N1 = np.argwhere(equal)[0][0]
-        N2 = np.argwhere(equal)[0][0]
-    elif equal.sum() > 1:
+    unit = planet_times.unit
+    times = planet_times.to_value(unit)
+    t = tindex.to_value(unit)
+    # binary search rather than comparing against every element
+    first_equal = int(np.searchsorted(times, t, side='left'))
+    first_after = int(np.searchsorted(times, t, side='right'))
+    n_equal = first_after - first_equal
+    if n_equal == 1:
+        N1 = first_equal
+        N2 = first_equal
+    elif n_equal > 1:
         raise ValueError('There must be a duplicate time')
-    elif equal.sum() == 0:
-        N2 = np.argwhere(after)[0][0]
+    else:
+        if first_after == len(times):
+            raise IndexError('`tindex` is after the last planet time')
+        N2 = first_after
         N1 = N2 - 1
-    return N1, N2
\ No newline at end of file
+    return N1, N2
@@ -9,7 +9,7 @@ and PSG.
 from pathlib import Path
 import warnings
 import logging
-from functools import partial
+from functools import partial, cached_property
 from typing import Dict, Tuple
 
 import numpy as np
@@ -74,6 +74,9 @@ class ObservationModel:
         self.rng = np.random.default_rng(self.params.header.seed)
         # Load later when needed.
         self.spec: GridSpectra | ForwardSpectra = None
+        self._spectrum_cache: Dict[float, u.Quantity] = {}
+        self._pyrad_cache: Dict[Tuple[str, int], libpypsg.PyRad] = {}
+        self._pylyr_cache: Dict[int, libpypsg.PyLyr] = {}
         self.star: vsm.Star = None
         self.bb = ForwardSpectra.blackbody()
         self.logger = logging.Logger('VSPEC')
@@ -192,11 +195,13 @@ class ObservationModel:
         else:
             raise NotImplementedError(f'Unsure how to build ``GridSpectra`` object from {p}')
 
-    @property
+    @cached_property
     def _wl(self)->u.Quantity:
         """
         The wavelength axis of the observation.
 
+        This is used many times per epoch, so it is computed once.
+
         Returns
         -------
         wl : astropy.units.Quantity
@@ -225,21 +230,30 @@ class ObservationModel:
         Notes
         -----
         This function applies the solid angle correction.
+
+        Spectra are cached by effective temperature, so the returned
+        array is read-only.
         """
+        key = float(teff.to_value(config.teff_unit))
+        if key in self._spectrum_cache:
+            return self._spectrum_cache[key]
         if self.spec is None:
             self.spec = self._load_spectra()
 
         
         if isinstance(self.params.header.spec_grid, VSPECGridParameters):
-            teffs = np.atleast_1d(teff.to_value(config.teff_unit))
-            return self.spec.evaluate(
+            teffs = np.atleast_1d(key)
+            flux = self.spec.evaluate(
                 params=(teffs,),
                 wl=np.array(self._wl.to_value(config.wl_unit))
             )[0, :] * config.flux_unit * self.params.flux_correction
         elif isinstance(self.params.header.spec_grid, BlackbodyGridParameters):
-            return self.spec.evaluate(self._wl, teff) * self.params.flux_correction
+            flux = self.spec.evaluate(self._wl, teff) * self.params.flux_correction
         else:
             raise TypeError(f'Unsure how to handle grid parameters of type {type(self.params.header.spec_grid)}')
+        flux.flags.writeable = False
+        self._spectrum_cache[key] = flux
+        return flux
 
     def get_observation_parameters(self) -> SystemGeometry:
         """
@@ -302,6 +316,23 @@ class ObservationModel:
 
         return observation_parameters.get_observation_plan(start_times)
 
+    @cached_property
+    def _planet_times(self) -> np.ndarray:
+        """
+        The times of the planet observation plan in ``config.time_unit``.
+
+        Every PSG interpolator shares these, so the plan is only solved once.
+
+        Returns
+        -------
+        np.ndarray
+            The time of each planet epoch.
+        """
+        observation_parameters = self.get_observation_parameters()
+        observation_info = self._get_observation_plan(
+            observation_parameters, planet=True)
+        return observation_info['time'].to_value(config.time_unit)
+
     def _check_psg(self):
         """
         Check that PSG is configured correctly.
@@ -529,6 +560,9 @@ class ObservationModel:
         """
         # check that psg is running
         self._check_psg()
+        # the PSG outputs are about to be overwritten
+        self._clear_pyrad_cache()
+        self._pylyr_cache.clear()
         # for not using globes, append all configurations instead of rewritting
 
         ####################################
@@ -557,6 +591,16 @@ class ObservationModel:
                 f'Starting at phase {self.params.planet.init_phase}, observe for {self.params.obs.observation_time} in {self.params.planet_total_images} steps')
             print('Phases = ' +
                   str(np.round(np.asarray((obs_plan['phase']/u.deg).to(u.Unit(''))), 2)) + ' deg')
+        # where the outputs of each PSG call are written
+        combined_paths = {
+            'rad': Path(self.directories['psg_combined']),
+            'noi': Path(self.directories['psg_noise']),
+            'cfg': Path(self.directories['psg_configs']),
+        }
+        thermal_paths = {
+            'rad': Path(self.directories['psg_thermal']),
+            'lyr': Path(self.directories['psg_layers'])
+        }
         ####################################
         # iterate through phases
         for i in self._wrap_iterator(range(self.params.planet_total_images+1), desc='Build Planet', total=self.params.planet_total_images+1):
@@ -589,25 +633,16 @@ class ObservationModel:
                 pl_sub_obs_lat=pl_sub_obs_lat
             )
             
-            path_dict = {
-                'rad': Path(self.directories['psg_combined']),
-                'noi': Path(self.directories['psg_noise']),
-                'cfg': Path(self.directories['psg_configs']),
-            }
             update_config(
                 include_star=True,
-                path_dict=path_dict,
+                path_dict=combined_paths,
                 i=i
             )
             # write updates to config file to remove star flux
             
-            path_dict = {
-                'rad': Path(self.directories['psg_thermal']),
-                'lyr': Path(self.directories['psg_layers'])
-            }
             update_config(
                 include_star=False,
-                path_dict=path_dict,
+                path_dict=thermal_paths,
                 i=i
             )
 
@@ -667,7 +702,7 @@ class ObservationModel:
         phase: u.Quantity = 90*u.deg,
         inclination: u.Quantity = 0*u.deg,
         transit_depth: np.ndarray | float = 0
-    )->Tuple[u.Quantity, u.Quantity]:
+    )->Tuple[u.Quantity, u.Quantity, u.Quantity]:
         """
         Compute the stellar spectrum given an integration window and the
         side of the star facing the observer.
@@ -685,10 +720,13 @@ class ObservationModel:
 
         Returns
         -------
-        base_wave : astropy.units.Quantity [wavelength]
-            The wavelength coordinates of the stellar spectrum.
         base_flux : astropy.units.Quantity [flambda]
-            The composite stellar flux
+            The composite stellar flux, without the transit.
+        transit_flux : astropy.units.Quantity [flambda]
+            The stellar flux blocked by the planet. Subtract it from
+            `base_flux` to get the flux seen during the transit.
+        pl_frac : float
+            The fraction of the planet that is visible.
 
         Raises
         ------
@@ -705,26 +743,25 @@ class ObservationModel:
         )
         visible_flares = self.star.get_flare_int_over_timeperiod(
             tstart, tfinish, sub_obs_coords)
-        base_flux = self._get_model_spectrum(self.params.star.teff)
-        base_flux = base_flux * 0
-        # add up star flux before considering transit
-        for teff, coverage in total.items():
-            if coverage > 0:
-                flux = self._get_model_spectrum(u.Quantity(teff))
-                if not flux.shape == base_flux.shape:
-                    raise ValueError('All arrays must have same shape.')
-                base_flux = base_flux + flux * coverage
-        # get flux of transited region
-        transit_flux = base_flux*0
-        for teff, coverage in covered.items():
-            if coverage > 0:
-                flux = self._get_model_spectrum(u.Quantity(teff))
-                if not flux.shape == base_flux.shape:
-                    raise ValueError('All arrays must have same shape.')
-                transit_flux = transit_flux + flux * coverage
+        wl = self._wl
+        # Do the arithmetic on plain arrays in `config.flux_unit` and only
+        # attach the unit to the result. Each Teff region is weighted by its
+        # visible coverage (column 0) and by the coverage of the transited
+        # region (column 1), so both sums are a single matrix product.
+        teffs = list(total.keys()) + [teff for teff in covered if teff not in total]
+        weights = np.array([
+            [total.get(teff, 0.), covered.get(teff, 0.)] for teff in teffs
+        ], dtype=float).reshape(-1, 2)
+        used = np.any(weights > 0, axis=1)
+        spectra = np.zeros((used.sum(), wl.size))
+        for i, teff in enumerate(t for t, keep in zip(teffs, used) if keep):
+            flux = self._get_model_spectrum(u.Quantity(teff)).to_value(config.flux_unit)
+            if not flux.shape == wl.shape:
+                raise ValueError('All arrays must have same shape.')
+            spectra[i] = flux
+        base_flux, transit_flux = np.clip(weights[used], 0, None).T @ spectra
         # scale according to effective radius
-        transit_flux = transit_flux * transit_depth
-        base_flux = base_flux - transit_flux
+        transit_flux *= transit_depth
         # add in flares
         for flare in visible_flares:
             teff = flare['Teff']
@@ -732,10 +769,10 @@ class ObservationModel:
             eff_area = (timearea/(tfinish-tstart)).to(u.km**2)
             correction = (eff_area/self.params.system.distance **
                           2).to_value(u.dimensionless_unscaled)
-            flux = self.bb.evaluate(self._wl, teff) * correction
-            base_flux = base_flux + flux
+            flux = self.bb.evaluate(wl, teff).to_value(config.flux_unit) * correction
+            base_flux += flux
 
-        return base_flux.to(config.flux_unit), pl_frac
+        return base_flux * config.flux_unit, transit_flux * config.flux_unit, pl_frac
 
     def _get_pyrad(
         self,
@@ -744,7 +781,14 @@ class ObservationModel:
     )-> libpypsg.PyRad:
         """
         Read a rad file.
+
+        Each interpolator needs several columns from the same files,
+        so parsed files are kept in ``self._pyrad_cache`` until
+        ``self._clear_pyrad_cache`` is called.
         """
+        key = (kind, index)
+        if key in self._pyrad_cache:
+            return self._pyrad_cache[key]
         match kind:
             case 'thermal':
                 path = self.directories['psg_thermal'] / get_filename(index, N_ZFILL, 'fits')
@@ -752,7 +796,15 @@ class ObservationModel:
                 path = self.directories['psg_combined'] / get_filename(index, N_ZFILL, 'fits')
             case 'noise':
                 path = self.directories['psg_noise'] / get_filename(index, N_ZFILL, 'fits')
-        return libpypsg.PyRad.read(path, format='fits')
+        rad = libpypsg.PyRad.read(path, format='fits')
+        self._pyrad_cache[key] = rad
+        return rad
+
+    def _clear_pyrad_cache(self):
+        """
+        Forget any rad files read by ``self._get_pyrad``.
+        """
+        self._pyrad_cache.clear()
     
     def _get_psg_interp(
         self,
@@ -762,10 +814,7 @@ class ObservationModel:
         """
         Create an interpolaor from PSG outputs.
         """
-        observation_parameters = self.get_observation_parameters()
-        observation_info = self._get_observation_plan(
-            observation_parameters, planet=True)
-        times = observation_info['time'].to_value(config.time_unit)
+        times = self._planet_times
         spectra = [
             self._get_pyrad(kind, i)[name].to_value(config.flux_unit) for i in range(self.params.planet_total_images+1)
         ]
@@ -824,10 +873,7 @@ class ObservationModel:
         """
         Get an interpolator for the thermal spectra.
         """
-        observation_parameters = self.get_observation_parameters()
-        observation_info = self._get_observation_plan(
-            observation_parameters, planet=True)
-        times = observation_info['time'].to_value(config.time_unit)
+        times = self._planet_times
         spectra = []
         for i in range(self.params.planet_total_images+1):
             pyrad = self._get_pyrad('thermal', i)
@@ -850,10 +896,7 @@ class ObservationModel:
         """
         Get an interpolator for the reflected spectra.
         """
-        observation_parameters = self.get_observation_parameters()
-        observation_info = self._get_observation_plan(
-            observation_parameters, planet=True)
-        times = observation_info['time'].to_value(config.time_unit)
+        times = self._planet_times
         spectra = []
         for i in range(self.params.planet_total_images+1):
             combined = self._get_pyrad('combined', i)
@@ -880,10 +923,7 @@ class ObservationModel:
         """
         Get an interpolator for the transit spectra.
         """
-        observation_parameters = self.get_observation_parameters()
-        observation_info = self._get_observation_plan(
-            observation_parameters, planet=True)
-        times = observation_info['time'].to_value(config.time_unit)
+        times = self._planet_times
         spectra = []
         for i in range(self.params.planet_total_images+1):
             try:
@@ -987,17 +1027,21 @@ class ObservationModel:
         """
         photon_noise = photon_noise_interpolator.evaluate((np.array([start_time,end_time]),),self._wl).mean(axis=0)
         star = star_interpolator.evaluate((np.array([start_time,end_time]),),self._wl).mean(axis=0)
-        model_noise = photon_noise * np.sqrt(cmb_flux.to_value(config.flux_unit)/star)
+        # square of the photon noise scaled to our model; no need to take the
+        # square root only to square it again below.
+        noise_sq = photon_noise**2 * (cmb_flux.to_value(config.flux_unit)/star)
         
         detector_noise = detector_noise_interpolator.evaluate((np.array([start_time,end_time]),),self._wl).mean(axis=0)
         telescope_noise = telescope_noise_interpolator.evaluate((np.array([start_time,end_time]),),self._wl).mean(axis=0)
         background_noise = background_noise_interpolator.evaluate((np.array([start_time,end_time]),),self._wl).mean(axis=0)
 
-        noise_sq = (model_noise**2
-                    + (detector_noise)**2
-                    + (telescope_noise)**2
-                    + (background_noise)**2)
-        return np.sqrt(noise_sq) * time_scale_factor
+        # accumulate in place rather than building a temporary per term
+        noise_sq += detector_noise**2
+        noise_sq += telescope_noise**2
+        noise_sq += background_noise**2
+        np.sqrt(noise_sq, out=noise_sq)
+        noise_sq *= time_scale_factor
+        return noise_sq
     
     @property
     def _thermal_name(self):
@@ -1048,6 +1092,16 @@ class ObservationModel:
         spectra = _interp_thermal.evaluate((np.array([start_time,end_time]),),self._wl).mean(axis=0)
         return spectra * pl_frac * config.flux_unit
 
+    def _get_pylyr(self, index: int) -> libpypsg.PyLyr:
+        """
+        Read a PSG .lyr file, reusing it if it was read for the last epoch.
+        """
+        if index not in self._pylyr_cache:
+            path = Path(
+                self.directories['psg_layers']) / get_filename(index, N_ZFILL, 'fits')
+            self._pylyr_cache[index] = libpypsg.PyLyr.from_fits(path)
+        return self._pylyr_cache[index]
+
     def _get_layer_data(self, N1: int, N2: int, N1_frac: float) -> libpypsg.PyLyr:
         """
         Interpolate between two PSG .lyr files.
@@ -1071,12 +1125,12 @@ class ObservationModel:
         ValueError
             If the layer file columns of layer numbers do not match.
         """
-        psg_layers_path1 = Path(
-            self.directories['psg_layers']) / get_filename(N1, N_ZFILL, 'fits')
-        psg_layers_path2 = Path(
-            self.directories['psg_layers']) / get_filename(N2, N_ZFILL, 'fits')
-        layers1 = libpypsg.PyLyr.from_fits(psg_layers_path1)
-        layers2 = libpypsg.PyLyr.from_fits(psg_layers_path2)
+        layers1 = self._get_pylyr(N1)
+        layers2 = self._get_pylyr(N2)
+        # consecutive epochs usually share planet epochs, so only
+        # keep the pair we just used.
+        for index in [key for key in self._pylyr_cache if key not in (N1, N2)]:
+            del self._pylyr_cache[index]
 
         if not np.all(layers1.prof.colnames == layers2.prof.colnames):
             raise ValueError(
@@ -1160,32 +1214,48 @@ class ObservationModel:
         s+=', transit'
         print(s)
         interp_transit = self._get_transit_interpolator()
+        self._clear_pyrad_cache()
         print('Finished!')
 
+        time_scale_factor = np.sqrt(
+            (planet_time_step/time_step).to_value(u.dimensionless_unscaled))
+        wl = self._wl
+        # The planet epochs bracketing each stellar epoch only depend on the
+        # observation plan, so build the whole lookup table up front.
+        planet_indices = [
+            get_planet_indicies(planet_times, tindex) for tindex in observation_info['time']
+        ]
+        N2s = np.array([N2 for _, N2 in planet_indices], dtype=int)
+        N1_fracs = ((planet_times[N2s] - observation_info['time'])/planet_time_step
+                    ).to_value(u.dimensionless_unscaled)
+
         for index in self._wrap_iterator(range(self.params.obs.total_images), desc='Build Spectra', total=self.params.obs.total_images, position=0, leave=True):
             tindex = observation_info['time'][index]
             tstart = tindex - observation_info['time'][0]
             tfinish = tstart + time_step
+            start_time = tstart.to_value(config.time_unit)
+            end_time = tfinish.to_value(config.time_unit)
             planet_phase = observation_info['phase'][index]
             sub_obs_lon = observation_info['sub_obs_lon'][index]
             sub_obs_lat = observation_info['sub_obs_lat'][index]
             orbital_radius = observation_info['orbit_radius'][index] * \
                 self.params.planet.semimajor_axis
             granulation_fraction = granulation_fractions[index]
-            N1, N2 = get_planet_indicies(planet_times, tindex)
-            N1_frac = (planet_times[N2] - tindex)/planet_time_step
-            N1_frac = N1_frac.to_value(u.dimensionless_unscaled)
+            N1, N2 = planet_indices[index]
+            N1_frac = N1_fracs[index]
 
             sub_planet_lon = observation_info['sub_planet_lon'][index]
             sub_planet_lat = observation_info['sub_planet_lat'][index]
             
             transit_depth = self._get_transit(
-                start_time=tstart.to_value(config.time_unit),
-                end_time=tfinish.to_value(config.time_unit),
+                start_time=start_time,
+                end_time=end_time,
                 transit_interpolator=interp_transit,
             )
 
-            comp_flux, pl_frac = self._calculate_composite_stellar_spectrum(
+            # The in- and out-of-transit spectra share the same coverage and
+            # flares, so compute them together and subtract the blocked flux.
+            true_star, transit_flux, pl_frac = self._calculate_composite_stellar_spectrum(
                 {'lat': sub_obs_lat, 'lon': sub_obs_lon}, tstart, tfinish,
                 granulation_fraction=granulation_fraction,
                 orbit_radius=orbital_radius,
@@ -1194,31 +1264,23 @@ class ObservationModel:
                 inclination=self.params.system.inclination,
                 transit_depth=transit_depth
             )
-            true_star, _ = self._calculate_composite_stellar_spectrum(
-                {'lat': sub_obs_lat, 'lon': sub_obs_lon}, tstart, tfinish,
-                granulation_fraction=granulation_fraction,
-                orbit_radius=orbital_radius,
-                planet_radius=self.params.planet.radius,
-                phase=planet_phase,
-                inclination=self.params.system.inclination,
-                transit_depth=0.
-            )
-            to_planet_flux, _ = self._calculate_composite_stellar_spectrum(
+            comp_flux = true_star - transit_flux
+            to_planet_flux, _, _ = self._calculate_composite_stellar_spectrum(
                 {'lat': sub_planet_lat, 'lon': sub_planet_lon}, tstart, tfinish,
                 granulation_fraction=granulation_fraction
             )
 
             reflection_flux_adj = self._calculate_reflected_spectra(
-                start_time=tstart.to_value(config.time_unit),
-                end_time=tfinish.to_value(config.time_unit),
+                start_time=start_time,
+                end_time=end_time,
                 reflected_interpolator=interp_reflected,
                 stellar_interpolator=interp_stellar,
                 sub_planet_flux=to_planet_flux,
                 pl_frac=pl_frac
             )
             thermal_spectrum = self._get_thermal_spectrum(
-                start_time=tstart.to_value(config.time_unit),
-                end_time=tfinish.to_value(config.time_unit),
+                start_time=start_time,
+                end_time=end_time,
                 _interp_thermal=interp_thermal,
                 pl_frac=pl_frac
             )
@@ -1226,18 +1288,17 @@ class ObservationModel:
             combined_flux: u.Quantity = comp_flux + reflection_flux_adj + thermal_spectrum
             
             noise_flux_adj = self._calculate_noise(
-                start_time=tstart.to_value(config.time_unit),
-                end_time=tfinish.to_value(config.time_unit),
+                start_time=start_time,
+                end_time=end_time,
                 photon_noise_interpolator=interp_noise_photon,
                 detector_noise_interpolator=interp_noise_detector,
                 telescope_noise_interpolator=interp_noise_telescope,
                 background_noise_interpolator=interp_noise_background,
                 star_interpolator=interp_stellar,
-                time_scale_factor=np.sqrt((planet_time_step/time_step).to_value(u.dimensionless_unscaled)),
+                time_scale_factor=time_scale_factor,
                 cmb_flux=combined_flux
             )
 
-            wl = self._wl
             data: Dict[str, u.Quantity] = {}
             data['wavelength'] = wl
             data['star'] = true_star
@@ -1263,3 +1324,4 @@ class ObservationModel:
             self.star.birth_spots(time_step)
             self.star.birth_faculae(time_step)
             self.star.age(time_step)
+        self._pylyr_cache.clear()
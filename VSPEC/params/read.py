@@ -2,6 +2,7 @@
 Module to read parameters
 """
 from typing import Callable, List, Union
+from functools import cached_property
 from pathlib import Path
 import yaml
 from astropy import units as u
@@ -488,11 +489,13 @@ class InternalParameters(BaseParameters):
             gcm=None
         )
 
-    @property
+    @cached_property
     def flux_correction(self) -> float:
         """
         The flux correction for the stellar radius and distance.
 
+        Computed on first access and then cached.
+
         Returns
         -------
         float
@@ -500,11 +503,13 @@ class InternalParameters(BaseParameters):
         """
         return (self.star.radius/self.system.distance).to_value(u.dimensionless_unscaled)**2
 
-    @property
+    @cached_property
     def star_total_images(self) -> int:
         """
         The number of epochs to simulate for the stellar model.
 
+        Computed on first access and then cached.
+
         Returns
         -------
         int
@@ -512,11 +517,13 @@ class InternalParameters(BaseParameters):
         """
         return self.obs.total_images
 
-    @property
+    @cached_property
     def planet_total_images(self) -> int:
         """
         The number of epochs to simulate for the planet model.
 
+        Computed on first access and then cached.
+
         Returns
         -------
         int
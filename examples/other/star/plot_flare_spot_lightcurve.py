@@ -18,7 +18,6 @@ from VSPEC import config
 from VSPEC.params.gcm import vspec_to_pygcm
 
 SEED = 42
-libpypsg.docker.set_url_and_run()
 
 # %%
 # Initialize the VSPEC run parameters
@@ -132,6 +131,10 @@ parameters = params.InternalParameters(
 # Run the simulation
 # ------------------
 #
+# PSG is only needed from here on, so start
+# the container just before we use it.
+
+libpypsg.docker.set_url_and_run()
 
 model = ObservationModel(params=parameters)
 model.build_planet()
@@ -154,17 +157,38 @@ data = PhaseAnalyzer(model.directories['all_model'])
 time = (data.time - data.time[0]).to_value(u.day)
 wl = data.wavelength.to_value(u.um)
 
-emission = (data.thermal/data.total).to_value(u.dimensionless_unscaled)*1e6
+# Strip the units once and scale in place to avoid
+# creating a new full-size array at every step.
+therm = data.thermal.to_value(data.total.unit)
+tot = data.total.value
+star = data.star.value
+
+emission = therm/tot
+emission *= 1e6
+
+variation = star/star[:,0:1]
+variation -= 1
+variation *= 100
+
+# The wavelength axis is not evenly spaced, but the grid is
+# still rectilinear, so ``pcolorfast`` can draw each panel as
+# a single image instead of one patch per cell. It needs the
+# cell edges rather than the cell centers.
+
+def cell_edges(centers:np.ndarray)->np.ndarray:
+    mid = 0.5*(centers[1:]+centers[:-1])
+    return np.concatenate([[2*centers[0]-mid[0]],mid,[2*centers[-1]-mid[-1]]])
 
-variation = (data.star/data.star[:,0,np.newaxis]-1).to_value(u.dimensionless_unscaled)*100
+time_edges = cell_edges(time)
+wl_edges = cell_edges(wl)
 
 fig,ax = plt.subplots(1,2,figsize=(8,4))
 
-im=ax[0].pcolormesh(time,wl,emission,cmap='cividis')
+im=ax[0].pcolorfast(time_edges,wl_edges,emission,cmap='cividis')
 fig.colorbar(im,ax=ax[0],label='Planet Thermal Emission (ppm)',location='top')
 # ax[0].set_title('Planet')
 
-im=ax[1].pcolormesh(time,wl,variation,cmap='cividis')
+im=ax[1].pcolorfast(time_edges,wl_edges,variation,cmap='cividis')
 fig.colorbar(im,ax=ax[1],label='Stellar Variation (%)',location='top')
 # ax[1].set_title('Star')
 
@@ -8,6 +8,8 @@ from libpypsg import settings
 
 import VSPEC
 
+_TEST1_YAML = Path(__file__).parent / 'end_to_end_tests' / 'test1' / 'test1.yaml'
+
 def pytest_addoption(parser: pytest.Parser) -> None:
     """
     Add options to pytest.
@@ -15,7 +17,7 @@ def pytest_addoption(parser: pytest.Parser) -> None:
     parser.addoption('--external', action='store_true', help='use the external psg URL')
     parser.addoption('--test1', action='store_true', help='rerun test 1')
 
-@pytest.fixture
+@pytest.fixture(scope='session')
 def psg_url(request: pytest.FixtureRequest)->str:
     """
     Decide which psg URL to use.
@@ -23,23 +25,25 @@ def psg_url(request: pytest.FixtureRequest)->str:
     external = request.config.getoption('--external')
     return settings.PSG_URL if external else settings.INTERNAL_PSG_URL
 
-@pytest.fixture
+@pytest.fixture(scope='session')
 def test1_data(request: pytest.FixtureRequest) -> VSPEC.PhaseAnalyzer:
     """
     Run end-to-end test 1.
+
+    Shared by the whole session; tests must not modify it.
     """
-    path = Path(__file__).parent / 'end_to_end_tests' / 'test1' / 'test1.yaml'
-    model = VSPEC.ObservationModel.from_yaml(path)
+    model = VSPEC.ObservationModel.from_yaml(_TEST1_YAML)
     rerun = request.config.getoption('--test1')
     if rerun:
         model.build_planet()
         model.build_spectra()
     return VSPEC.PhaseAnalyzer(model.directories['all_model'])
 
-@pytest.fixture
+@pytest.fixture(scope='session')
 def test1_model(request: pytest.FixtureRequest) -> VSPEC.ObservationModel:
     """
     Model for test 1.
+
+    Shared by the whole session; tests must not modify it.
     """
-    path = Path(__file__).parent / 'end_to_end_tests' / 'test1' / 'test1.yaml'
-    return VSPEC.ObservationModel.from_yaml(path)
\ No newline at end of file
+    return VSPEC.ObservationModel.from_yaml(_TEST1_YAML)
\ No newline at end of file
@@ -127,6 +127,25 @@ def test_init_from_model(test1_model):
     test1_data = PhaseAnalyzer.from_model(test1_model)
     assert isinstance(test1_data, PhaseAnalyzer)
 
+def test_init_from_fits(test1_data:PhaseAnalyzer, tmp_path:Path):
+    """
+    Test `PhaseAnalyzer.from_fits()`
+    """
+    filename = tmp_path / 'test1.fits'
+    test1_data.write_fits(filename)
+    data = PhaseAnalyzer.from_fits(filename)
+    assert isinstance(data, PhaseAnalyzer)
+    assert data.n_images == test1_data.n_images
+    assert data._observation_data.colnames == test1_data._observation_data.colnames
+    for attr in ('time', 'phase', 'unique_phase', 'wavelength',
+                 'star', 'reflected', 'thermal', 'total', 'noise'):
+        expected = getattr(test1_data, attr)
+        result = getattr(data, attr)
+        assert isinstance(result, u.Quantity)
+        assert result.unit == expected.unit
+        assert np.all(result == expected)
+    assert len(data.layers) == 0
+
 
 
 
@@ -2,6 +2,7 @@
 
 from astropy import units as u
 import numpy as np
+import pytest
 from pathlib import Path
 
 from VSPEC import helpers
@@ -16,9 +17,19 @@ def test_get_planet_indices():
 
     N1, N2 = helpers.get_planet_indicies(planet_times, tindex)
 
+    assert N1 == 2
+    assert N2 == 3
+
     planet_times = np.array([0, 1, 2, 3, 4]) * u.day
     tindex = 2 * u.day
     N1, N2 = helpers.get_planet_indicies(planet_times, tindex)
 
     assert N1 == 2
     assert N2 == 2
+
+    N1, N2 = helpers.get_planet_indicies(planet_times, 36 * u.hr)
+    assert N1 == 1
+    assert N2 == 2
+
+    with pytest.raises(ValueError):
+        helpers.get_planet_indicies(np.array([0, 1, 1, 2]) * u.day, 1 * u.day)